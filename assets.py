@@ -0,0 +1,140 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+
+import metrics
+
+# Built by build_assets.py
+MANIFEST_PATH = "Assets/build/manifest.json"
+COLUMN_WIDTH = 704
+# Variants are picked for 2x screens, otherwise HiDPI displays upscale a blurry image.
+# Streamlit downsizes anything wider than 1460px, which the largest 1408px variant stays under.
+PIXEL_DENSITY = 2
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class AssetCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # path -> (mtime_ns, size, value)
+        self._lock = threading.Lock()
+
+    def get(self, path, loader):
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stat.st_mtime_ns:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = loader(path)
+
+        with self._lock:
+            # Either never loaded or changed on disk since: drop whatever we held
+            stale = self._entries.pop(path, None)
+            if stale is not None:
+                self.total_bytes -= stale[1]
+            if stat.st_size <= self.max_bytes:
+                self._entries[path] = (stat.st_mtime_ns, stat.st_size, value)
+                self.total_bytes += stat.st_size
+                while self.total_bytes > self.max_bytes:
+                    _, (_, size, _) = self._entries.popitem(last=False)
+                    self.total_bytes -= size
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# One cache per server process, shared by every session and rerun
+@st.cache_resource
+def get_asset_cache():
+    return AssetCache(CACHE_MAX_BYTES)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def read_bytes(path):
+    return get_asset_cache().get(path, _read_bytes)
+
+
+def load_json(path):
+    return get_asset_cache().get(path, _read_json)
+
+
+def load_lottie_file(file_path):
+    return load_json(file_path)
+
+
+def cache_stats():
+    return get_asset_cache().stats()
+
+
+def load_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    return load_json(MANIFEST_PATH)
+
+
+def pick_variant(path, width=COLUMN_WIDTH * PIXEL_DENSITY, fmt=None):
+    entry = load_manifest().get(path)
+    if entry is None:
+        return path
+    if fmt is None:
+        fmt = entry["fallback_format"]
+
+    candidates = sorted(
+        (v for v in entry["variants"] if v["format"] == fmt),
+        key=lambda v: v["width"],
+    )
+    if not candidates:
+        return path
+
+    # Smallest variant that still covers the display width, else the largest we have
+    for variant in candidates:
+        if variant["width"] >= width:
+            return variant["path"]
+    return candidates[-1]["path"]
+
+
+def show_image(path, caption=None, width=None):
+    start = time.perf_counter()
+    if width is None:
+        data = read_bytes(pick_variant(path))
+        st.image(data, caption=caption, width="stretch")
+    else:
+        data = read_bytes(pick_variant(path, width * PIXEL_DENSITY))
+        st.image(data, caption=caption, width=width)
+    metrics.record_media(len(data), time.perf_counter() - start)
@@ -0,0 +1,234 @@
+# Headless benchmarks for the documentation app, run from the repository root:
+#
+#   python benchmarks/bench_app.py                     compare against benchmarks/baseline.json
+#   python benchmarks/bench_app.py --update-baseline   record a new baseline
+#
+# Exits with status 1 when a result regresses past the tolerances below. Timings are compared
+# after scaling the baseline by a calibration workload timed in the same run, which absorbs a
+# uniformly faster or slower machine but not one that is busy with something else. When the
+# checked-in baseline keeps failing on an untouched tree, record one locally first.
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import metrics  # noqa: E402
+from sections import PAGES  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+IMPORT_RUNS = 5
+FIRST_RENDER_RUNS = 3
+CALIBRATION_RUNS = 3
+RERUNS = 20
+TIMEOUT = 60
+
+# Timings may double before failing, and differences under 25 ms are noise either way. Media
+# bytes are deterministic; retained memory is a small tracemalloc reading that moves between runs.
+TIME_TOLERANCE = 1.0
+TIME_FLOOR = 0.025
+SIZE_TOLERANCE = 0.1
+MEMORY_TOLERANCE = 0.5
+MEMORY_FLOOR_KB = 256
+# A p95 over 20 reruns is the second slowest rerun, so one scheduler hiccup moves it; reported only
+REPORT_ONLY = ("calibration_s", "rerun_p95_s")
+
+IMPORT_COMPONENTS = (
+    "import time; start = time.perf_counter(); "
+    "import streamlit, streamlit_agraph, streamlit_option_menu, streamlit_lottie; "
+    "print(time.perf_counter() - start)"
+)
+IMPORT_APP = (
+    "import time, streamlit; start = time.perf_counter(); "
+    "import app; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def calibration_time():
+    # Fixed pure-Python work standing in for how fast this machine runs the app right now
+    times = []
+    for _ in range(CALIBRATION_RUNS):
+        start = time.perf_counter()
+        sorted(json.dumps({"id": i, "name": str(i) * 8}) for i in range(50_000))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def import_time(code):
+    return statistics.median(float(run_python(code)) for _ in range(IMPORT_RUNS))
+
+
+def first_render(title):
+    # Fresh process, so nothing the page needs has been imported or cached yet. The page is selected
+    # before the first run, so every page is timed over the same cold script run.
+    start = time.perf_counter()
+    at = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT)
+    at.session_state["page"] = title
+    at.run()
+    seconds = time.perf_counter() - start
+    assert not at.exception, at.exception
+    return seconds
+
+
+def first_render_in_subprocess(title):
+    code = (
+        f"import sys; sys.path.insert(0, 'benchmarks'); "
+        f"import bench_app; print(bench_app.first_render({title!r}))"
+    )
+    return statistics.median(float(run_python(code)) for _ in range(FIRST_RENDER_RUNS))
+
+
+def rerun_times(at, title):
+    at.sidebar.radio[0].set_value(title).run()
+    times = []
+    for _ in range(RERUNS):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    assert not at.exception, at.exception
+    times.sort()
+    return statistics.median(times), times[int(0.95 * (len(times) - 1))]
+
+
+def media_bytes_per_view(at, title):
+    before = metrics.get_metrics().snapshot()["pages"].get(title, {"media_bytes": 0, "renders": 0})
+    at.sidebar.radio[0].set_value(title).run()
+    after = metrics.get_metrics().snapshot()["pages"][title]
+    return (after["media_bytes"] - before["media_bytes"]) // (after["renders"] - before["renders"])
+
+
+def session_memory_kb():
+    # Memory still held by one more session after it has visited every page, with shared caches warm
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    at = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT).run()
+    for title in PAGES:
+        at.sidebar.radio[0].set_value(title).run()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del at
+    return retained // 1024
+
+
+def measure():
+    calibration = calibration_time()
+    results = {
+        "import_components_s": import_time(IMPORT_COMPONENTS),
+        "import_app_s": import_time(IMPORT_APP),
+        "pages": {},
+    }
+
+    # Reruns are timed with metrics off, as the app runs by default
+    metrics.ENABLED = False
+    at = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT).run()
+    for title in PAGES:
+        p50, p95 = rerun_times(at, title)
+        results["pages"][title] = {
+            "first_render_s": first_render_in_subprocess(title),
+            "rerun_p50_s": p50,
+            "rerun_p95_s": p95,
+        }
+
+    metrics.ENABLED = True
+    at = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT).run()
+    for title in PAGES:
+        results["pages"][title]["media_bytes"] = media_bytes_per_view(at, title)
+    metrics.ENABLED = False
+
+    results["session_memory_kb"] = session_memory_kb()
+    # Timed before and after the benchmarks, so a machine that slows down halfway is reflected
+    results["calibration_s"] = statistics.median(calibration + calibration_time())
+    return results
+
+
+def flatten(results):
+    flat = {key: value for key, value in results.items() if key != "pages"}
+    for title, stats in results["pages"].items():
+        for key, value in stats.items():
+            flat[f"{title}.{key}"] = value
+    return flat
+
+
+def machine_scale(results, baseline):
+    if "calibration_s" not in baseline:
+        return 1.0
+    return results["calibration_s"] / baseline["calibration_s"]
+
+
+def regressions(results, baseline):
+    failures = []
+    current, previous = flatten(results), flatten(baseline)
+    scale = machine_scale(results, baseline)
+    for key, old in previous.items():
+        new = current.get(key)
+        if new is None or key.endswith(REPORT_ONLY):
+            continue
+        if key.endswith("_s"):
+            expected = old * scale
+            failed = new > expected * (1 + TIME_TOLERANCE) and new - expected > TIME_FLOOR
+        elif key == "session_memory_kb":
+            failed = new > old * (1 + MEMORY_TOLERANCE) and new - old > MEMORY_FLOOR_KB
+        else:
+            failed = new > old * (1 + SIZE_TOLERANCE)
+        if failed:
+            failures.append(f"{key}: {old:.4g} -> {new:.4g}")
+    return failures
+
+
+def report(results, baseline):
+    previous = flatten(baseline) if baseline else {}
+    for key, value in flatten(results).items():
+        old = previous.get(key)
+        change = f"  ({(value - old) / old:+.0%})" if old else ""
+        print(f"{key:<45} {value:>12.4g}{change}")
+
+
+def main():
+    results = measure()
+
+    if "--update-baseline" in sys.argv[1:]:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        report(results, None)
+        print(f"Baseline written to {os.path.relpath(BASELINE_PATH, ROOT)}")
+        return 0
+
+    baseline = None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r") as f:
+            baseline = json.load(f)
+    report(results, baseline)
+    if baseline is None:
+        print("No baseline found; run with --update-baseline to record one")
+        return 0
+    print(f"This run is {machine_scale(results, baseline):.2f}x the baseline's calibration time; timings are compared after scaling")
+
+    failures = regressions(results, baseline)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import sys
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+SOURCE_DIR = "Assets"
+BUILD_DIR = f"{SOURCE_DIR}/build"
+MANIFEST_PATH = f"{BUILD_DIR}/manifest.json"
+
+# Widths are in CSS pixels; 704 is the content width of Streamlit's centered layout
+WIDTHS = (300, 480, 704, 1024, 1408)
+FORMATS = {
+    "jpeg": {"quality": 85, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55},
+}
+# st.image re-encodes anything that is not JPEG/PNG/GIF on every call, so the live app only
+# gets variants in the format Streamlit passes through untouched; see build_modern
+MODERN_FORMATS = ("webp", "avif")
+SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+EXIF_ORIENTATION = 0x0112
+
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def file_hash(path):
+    return hashlib.sha256(read_file(path)).hexdigest()
+
+
+def available_formats():
+    return [fmt for fmt in MODERN_FORMATS if features.check(fmt)]
+
+
+def fallback_format(image):
+    return "png" if image.mode == "RGBA" else "jpeg"
+
+
+def variant_widths(source_width):
+    widths = [w for w in WIDTHS if w < source_width]
+    if source_width <= WIDTHS[-1]:
+        widths.append(source_width)
+    return widths
+
+
+def encode(image, fmt):
+    buffer = BytesIO()
+    image.save(buffer, format=fmt.upper(), **FORMATS[fmt])
+    return buffer.getvalue()
+
+
+def open_source(source_path):
+    with Image.open(source_path) as source:
+        source_format = source.format.lower()
+        upright = source.getexif().get(EXIF_ORIENTATION, 1) == 1
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    return image, source_format, upright
+
+
+def encode_variants(source_path, formats, out_dir):
+    image, source_format, upright = open_source(source_path)
+    formats = [fallback_format(image) if fmt == "fallback" else fmt for fmt in formats]
+
+    resized = {}
+    for width in variant_widths(image.width):
+        height = round(image.height * width / image.width)
+        resized[width] = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    variants = []
+    for fmt in formats:
+        kept, smallest = [], None
+        for width in sorted(resized, reverse=True):
+            data = encode(resized[width], fmt)
+            # Re-encoding an already compressed original at full size rarely pays off
+            if width == image.width and fmt == source_format and upright:
+                original = read_file(source_path)
+                if len(original) <= len(data):
+                    data = original
+            # A narrower variant that is no smaller than a wider one only costs detail
+            if smallest is not None and len(data) >= smallest:
+                continue
+            smallest = len(data)
+            kept.append((width, data))
+
+        for width, data in reversed(kept):
+            digest = hashlib.sha256(data).hexdigest()[:10]
+            path = f"{out_dir}/{stem}-{width}-{digest}.{fmt}"
+            with open(path, "wb") as f:
+                f.write(data)
+            variants.append({
+                "path": path,
+                "width": width,
+                "height": resized[width].height,
+                "format": fmt,
+                "bytes": len(data),
+            })
+
+    return image, formats, variants
+
+
+def build_variants(source_path):
+    image, formats, variants = encode_variants(source_path, ["fallback"], BUILD_DIR)
+    return {
+        "width": image.width,
+        "height": image.height,
+        "bytes": os.path.getsize(source_path),
+        "fallback_format": formats[0],
+        "variants": variants,
+    }
+
+
+def build_modern(manifest, out_dir):
+    # WebP/AVIF are only served by the static export, so they are encoded into its output
+    # instead of being committed next to the variants the live app reads
+    formats = available_formats()
+    return {path: encode_variants(path, formats, out_dir)[2] for path in manifest}
+
+
+def load_existing_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH, "r") as f:
+        return json.load(f)
+
+
+def build(force=False):
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    previous = load_existing_manifest()
+    manifest = {}
+
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        if not name.lower().endswith(SOURCE_EXTENSIONS):
+            continue
+        source_path = f"{SOURCE_DIR}/{name}"
+        source_hash = file_hash(source_path)
+
+        entry = previous.get(source_path)
+        up_to_date = (
+            entry is not None
+            and entry["source_hash"] == source_hash
+            and {v["format"] for v in entry["variants"]} == {entry["fallback_format"]}
+            and all(os.path.exists(v["path"]) for v in entry["variants"])
+        )
+        if up_to_date and not force:
+            manifest[source_path] = entry
+            continue
+
+        entry = build_variants(source_path)
+        entry["source_hash"] = source_hash
+        manifest[source_path] = entry
+        print(f"Built {len(entry['variants'])} variants for {source_path}")
+
+    # Drop variants that no longer belong to any manifest entry
+    referenced = {v["path"] for entry in manifest.values() for v in entry["variants"]}
+    for name in os.listdir(BUILD_DIR):
+        path = f"{BUILD_DIR}/{name}"
+        if path != MANIFEST_PATH and path not in referenced:
+            os.remove(path)
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    return manifest
+
+
+if __name__ == "__main__":
+    build(force="--force" in sys.argv[1:])
@@ -0,0 +1,154 @@
+import html
+import os
+import shutil
+import sys
+import textwrap
+
+from markdown_it import MarkdownIt
+
+import build_assets
+from sections import PAGES, load_module
+from sections.render import slugify
+
+DIST_DIR = "dist"
+ASSET_DIR = "assets"
+# Same display widths the live app picks variants for, see assets.COLUMN_WIDTH
+SIZES = "(max-width: 736px) 100vw, 704px"
+
+md = MarkdownIt("commonmark", {"html": True}).enable("table")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Suraksha Documentation</title>
+<style>
+body {{ margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; line-height: 1.6; color: #31333f; display: flex; }}
+nav {{ width: 240px; min-height: 100vh; padding: 2rem 1rem; background: #f0f2f6; box-sizing: border-box; flex-shrink: 0; }}
+nav a {{ display: block; padding: 0.25rem 0.5rem; color: inherit; text-decoration: none; border-radius: 0.25rem; }}
+nav a.active {{ background: #fff; font-weight: 600; }}
+main {{ max-width: 704px; padding: 3rem 1rem; margin: 0 auto; }}
+figure {{ margin: 1rem 0; }}
+img {{ max-width: 100%; height: auto; }}
+figcaption {{ font-size: 0.875rem; color: #808495; text-align: center; }}
+pre {{ background: #f0f2f6; padding: 1rem; border-radius: 0.5rem; overflow-x: auto; }}
+@media (max-width: 736px) {{ body {{ display: block; }} nav {{ width: auto; min-height: 0; }} }}
+</style>
+</head>
+<body>
+<nav>
+<h2>Navigation</h2>
+{nav}
+</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+def page_filename(title):
+    name = PAGES[title]
+    return "index.html" if name == "home" else f"{name}.html"
+
+
+def clean_text(text):
+    # Streamlit dedents and strips markdown and code bodies the same way
+    return textwrap.dedent(text).strip()
+
+
+def copy_asset(path, dist_dir):
+    name = os.path.basename(path)
+    target = os.path.join(dist_dir, ASSET_DIR, name)
+    if not os.path.exists(target):
+        shutil.copyfile(path, target)
+    return f"{ASSET_DIR}/{name}"
+
+
+def copy_original(path, dist_dir):
+    stem, ext = os.path.splitext(os.path.basename(path))
+    digest = build_assets.file_hash(path)[:10]
+    target = os.path.join(dist_dir, ASSET_DIR, f"{stem}-{digest}{ext}")
+    shutil.copyfile(path, target)
+    return f"{ASSET_DIR}/{os.path.basename(target)}"
+
+
+def render_image(path, caption, width, manifest, dist_dir):
+    entry = manifest.get(path)
+    caption_html = html.escape(caption) if caption else ""
+    style = f' style="width: {width}px"' if width else ""
+
+    if entry is None:
+        src = copy_original(path, dist_dir)
+        img = f'<img src="{src}" alt="{caption_html}" loading="lazy"{style}>'
+    else:
+        by_format = {}
+        for variant in sorted(entry["variants"], key=lambda v: v["width"]):
+            url = copy_asset(variant["path"], dist_dir)
+            by_format.setdefault(variant["format"], []).append(f"{url} {variant['width']}w")
+
+        sizes = f"{width}px" if width else SIZES
+        sources = [
+            f'<source type="image/{fmt}" srcset="{", ".join(by_format[fmt])}" sizes="{sizes}">'
+            for fmt in ("avif", "webp")
+            if fmt in by_format
+        ]
+        fallback = by_format[entry["fallback_format"]]
+        img = (
+            f'<img src="{fallback[-1].split()[0]}" srcset="{", ".join(fallback)}" sizes="{sizes}" '
+            f'width="{entry["width"]}" height="{entry["height"]}" alt="{caption_html}" loading="lazy"{style}>'
+        )
+        img = "<picture>" + "".join(sources) + img + "</picture>"
+
+    figcaption = f"<figcaption>{caption_html}</figcaption>" if caption else ""
+    return f"<figure>{img}{figcaption}</figure>"
+
+
+def render_block(block, manifest, dist_dir):
+    kind, *args = block
+    if kind == "title":
+        return f'<h1 id="{slugify(args[0])}">{html.escape(args[0])}</h1>'
+    if kind == "subheader":
+        return f'<h3 id="{slugify(args[0])}">{html.escape(args[0])}</h3>'
+    if kind in ("write", "markdown"):
+        return md.render(clean_text(args[0]))
+    if kind == "code":
+        return f'<pre><code class="language-{args[1]}">{html.escape(clean_text(args[0]))}</code></pre>'
+    if kind == "image":
+        width = args[2] if len(args) > 2 else None
+        return render_image(args[0], args[1], width, manifest, dist_dir)
+    if kind == "graph":
+        # The interactive graph needs the Streamlit component; static pages show its fallback image
+        return render_image(args[1], args[2], None, manifest, dist_dir)
+    raise ValueError(f"Unknown content block: {kind}")
+
+
+def render_nav(current):
+    links = []
+    for title in PAGES:
+        active = ' class="active"' if title == current else ""
+        links.append(f'<a href="{page_filename(title)}"{active}>{html.escape(title)}</a>')
+    return "\n".join(links)
+
+
+def export(dist_dir=DIST_DIR):
+    manifest = build_assets.build()
+
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    os.makedirs(os.path.join(dist_dir, ASSET_DIR))
+    modern = build_assets.build_modern(manifest, os.path.join(dist_dir, ASSET_DIR))
+    manifest = {path: {**entry, "variants": entry["variants"] + modern[path]} for path, entry in manifest.items()}
+
+    for title in PAGES:
+        content = load_module(title).CONTENT
+        body = "\n".join(render_block(block, manifest, dist_dir) for block in content)
+        page = PAGE_TEMPLATE.format(title=html.escape(title), nav=render_nav(title), body=body)
+        with open(os.path.join(dist_dir, page_filename(title)), "w", encoding="utf-8") as f:
+            f.write(page)
+        print(f"Exported {title} to {dist_dir}/{page_filename(title)}")
+
+
+if __name__ == "__main__":
+    export(sys.argv[1] if len(sys.argv) > 1 else DIST_DIR)
@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Opt-in: SURAKSHA_METRICS=1 enables collection, SURAKSHA_METRICS_LOG=path also appends one
+# JSON line per page render to that file
+ENABLED = os.getenv("SURAKSHA_METRICS") == "1"
+LOG_PATH = os.getenv("SURAKSHA_METRICS_LOG")
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class PageMetrics:
+    def __init__(self):
+        self.renders = defaultdict(int)
+        self.render_seconds = defaultdict(float)
+        self.render_buckets = defaultdict(lambda: [0] * len(BUCKETS))
+        self.images = defaultdict(int)
+        self.image_seconds = defaultdict(float)
+        self.media_bytes = defaultdict(int)
+        self.sessions = 0
+        self.page_sessions = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record_render(self, page, seconds, images, image_seconds, media_bytes, new_session, new_page_session):
+        with self._lock:
+            self.renders[page] += 1
+            self.render_seconds[page] += seconds
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    self.render_buckets[page][i] += 1
+            self.images[page] += images
+            self.image_seconds[page] += image_seconds
+            self.media_bytes[page] += media_bytes
+            self.sessions += new_session
+            self.page_sessions[page] += new_page_session
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "sessions": self.sessions,
+                "pages": {
+                    page: {
+                        "renders": self.renders[page],
+                        "render_seconds": self.render_seconds[page],
+                        "render_buckets": list(self.render_buckets[page]),
+                        "images": self.images[page],
+                        "image_seconds": self.image_seconds[page],
+                        "media_bytes": self.media_bytes[page],
+                        "sessions": self.page_sessions[page],
+                    }
+                    for page in self.renders
+                },
+            }
+
+
+@st.cache_resource
+def get_metrics():
+    return PageMetrics()
+
+
+# Per-render counters live on the script thread, so images are attributed to the page being drawn
+_current = threading.local()
+
+
+def record_media(num_bytes, seconds):
+    render = getattr(_current, "render", None)
+    if render is None:
+        return
+    render["images"] += 1
+    render["image_seconds"] += seconds
+    render["media_bytes"] += num_bytes
+
+
+def instrument(title, page):
+    if not ENABLED:
+        return page
+
+    def timed_page():
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx is not None else None
+        # Sessions are counted once through a flag in their own state, so nothing here grows with traffic
+        counted_pages = st.session_state.setdefault("_metrics_pages", set())
+        new_session = not counted_pages
+        new_page_session = title not in counted_pages
+        counted_pages.add(title)
+        _current.render = {"images": 0, "image_seconds": 0.0, "media_bytes": 0}
+        start = time.perf_counter()
+        try:
+            page()
+        finally:
+            seconds = time.perf_counter() - start
+            render = _current.render
+            _current.render = None
+            get_metrics().record_render(title, seconds, **render, new_session=new_session,
+                                        new_page_session=new_page_session)
+            if LOG_PATH:
+                write_log({"ts": time.time(), "page": title, "session": session_id, "seconds": seconds, **render})
+
+    return timed_page
+
+
+def write_log(entry):
+    with open(LOG_PATH, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+
+
+def prometheus_text(snapshot, asset_cache=None):
+    lines = [
+        "# HELP suraksha_sessions Distinct sessions that rendered at least one page.",
+        "# TYPE suraksha_sessions gauge",
+        f"suraksha_sessions {snapshot['sessions']}",
+        "# HELP suraksha_page_render_seconds Time spent rendering a page on rerun.",
+        "# TYPE suraksha_page_render_seconds histogram",
+    ]
+    pages = snapshot["pages"]
+    for page, stats in pages.items():
+        for bound, count in zip(BUCKETS, stats["render_buckets"]):
+            lines.append(f"suraksha_page_render_seconds_bucket{_labels(page=page, le=bound)} {count}")
+        lines.append(f"suraksha_page_render_seconds_bucket{_labels(page=page, le='+Inf')} {stats['renders']}")
+        lines.append(f"suraksha_page_render_seconds_sum{_labels(page=page)} {stats['render_seconds']}")
+        lines.append(f"suraksha_page_render_seconds_count{_labels(page=page)} {stats['renders']}")
+
+    series = (
+        ("suraksha_page_renders_total", "renders", "counter", "Page reruns."),
+        ("suraksha_page_images_total", "images", "counter", "Images sent by a page."),
+        ("suraksha_page_image_seconds_total", "image_seconds", "counter", "Time spent in st.image calls."),
+        ("suraksha_page_media_bytes_total", "media_bytes", "counter", "Bytes of media sent by a page."),
+        ("suraksha_page_sessions", "sessions", "gauge", "Distinct sessions that rendered a page."),
+    )
+    for name, key, kind, help_text in series:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for page, stats in pages.items():
+            lines.append(f"{name}{_labels(page=page)} {stats[key]}")
+
+    if asset_cache is not None:
+        for key, value in asset_cache.items():
+            if key in ("hits", "misses", "evictions"):
+                name, kind = f"suraksha_asset_cache_{key}_total", "counter"
+            else:
+                name, kind = f"suraksha_asset_cache_{key}", "gauge"
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {value}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,155 @@
+import bisect
+import math
+import re
+import textwrap
+from collections import Counter, defaultdict
+
+import streamlit as st
+
+from sections import PAGES, load_module
+from sections.render import slugify
+
+K1 = 1.5
+B = 0.75
+SNIPPET_CHARS = 160
+MAX_RESULTS = 5
+
+TOKEN = re.compile(r"\w+")
+MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+MARKDOWN_SYNTAX = re.compile(r"(\*\*|__|`+|^#+\s*|^\s*[-*]\s+)", re.MULTILINE)
+
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+
+def plain_text(kind, args):
+    if kind in ("title", "subheader"):
+        return args[0]
+    if kind in ("write", "markdown"):
+        text = MARKDOWN_LINK.sub(r"\1", textwrap.dedent(args[0]))
+        return MARKDOWN_SYNTAX.sub("", text)
+    if kind == "code":
+        return textwrap.dedent(args[0])
+    if kind == "image":
+        return args[1] or ""
+    if kind == "graph":
+        return " ".join(f"{label} {title}" for _, label, title in args[0]["nodes"])
+    return ""
+
+
+def split_sections(title, content):
+    # A new section starts at every title or subheader, which are the anchors pages can be scrolled to
+    sections = []
+    for kind, *args in content:
+        if kind in ("title", "subheader") or not sections:
+            heading = args[0] if kind in ("title", "subheader") else title
+            sections.append({"page": title, "heading": heading, "anchor": slugify(heading), "parts": []})
+        sections[-1]["parts"].append(plain_text(kind, args))
+    for section in sections:
+        section["text"] = " ".join(" ".join(section.pop("parts")).split())
+    return sections
+
+
+class SearchIndex:
+    def __init__(self, sections):
+        self.sections = sections
+        self.postings = defaultdict(list)  # term -> [(section index, term frequency)]
+        self.lengths = []
+        for i, section in enumerate(sections):
+            tokens = tokenize(section["text"])
+            self.lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                self.postings[term].append((i, tf))
+        self.vocabulary = sorted(self.postings)
+        self.average_length = sum(self.lengths) / max(len(self.lengths), 1)
+
+    def expand(self, term):
+        # The last word of a query is usually still being typed, so it also matches as a prefix
+        start = bisect.bisect_left(self.vocabulary, term)
+        end = bisect.bisect_left(self.vocabulary, term + "\uffff")
+        return self.vocabulary[start:end]
+
+    def search(self, query, limit=MAX_RESULTS):
+        terms = tokenize(query)
+        if not terms:
+            return []
+        expanded = [[term] for term in terms[:-1]] + [self.expand(terms[-1])]
+
+        scores = defaultdict(float)
+        n = len(self.sections)
+        for alternatives in expanded:
+            for term in alternatives:
+                postings = self.postings.get(term, ())
+                idf = math.log((n - len(postings) + 0.5) / (len(postings) + 0.5) + 1)
+                for i, tf in postings:
+                    norm = K1 * (1 - B + B * self.lengths[i] / self.average_length)
+                    scores[i] += idf * tf * (K1 + 1) / (tf + norm)
+
+        matched = {term for alternatives in expanded for term in alternatives}
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [
+            {**self.sections[i], "score": score, "snippet": snippet(self.sections[i]["text"], matched)}
+            for i, score in ranked
+        ]
+
+
+def snippet(text, terms):
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\w*", re.I)
+    match = pattern.search(text)
+    start = max((match.start() if match else 0) - SNIPPET_CHARS // 3, 0)
+    excerpt = text[start:start + SNIPPET_CHARS]
+
+    parts, last = [], 0
+    for m in pattern.finditer(excerpt):
+        parts.append(escape_markdown(excerpt[last:m.start()]))
+        parts.append(f"**{escape_markdown(m.group(0))}**")
+        last = m.end()
+    parts.append(escape_markdown(excerpt[last:]))
+    return ("…" if start else "") + "".join(parts) + ("…" if start + SNIPPET_CHARS < len(text) else "")
+
+
+def escape_markdown(text):
+    return re.sub(r"([\\`*_\[\]#<>|$])", r"\\\1", text)
+
+
+# Built on the first search in a process from the same content the pages render
+@st.cache_resource
+def get_search_index():
+    sections = []
+    for title in PAGES:
+        sections.extend(split_sections(title, load_module(title).CONTENT))
+    return SearchIndex(sections)
+
+
+def go_to(page, anchor):
+    st.session_state.page = page
+    st.session_state.scroll_to = anchor
+
+
+def sidebar_search():
+    query = st.sidebar.text_input("Search the docs", placeholder="e.g. Redis queue")
+    if not query:
+        return
+    results = get_search_index().search(query)
+    if not results:
+        st.sidebar.caption("No matches found.")
+    for i, result in enumerate(results):
+        st.sidebar.button(
+            f"{result['page']} › {result['heading']}",
+            key=f"search-result-{i}",
+            on_click=go_to,
+            args=(result["page"], result["anchor"]),
+        )
+        st.sidebar.caption(result["snippet"])
+
+
+def scroll_to_result():
+    anchor = st.session_state.pop("scroll_to", None)
+    if anchor:
+        # Runs in a same-origin iframe with no visible content once the page has been drawn
+        st.iframe(
+            f"<script>setTimeout(() => window.parent.document.getElementById('{anchor}')"
+            f"?.scrollIntoView({{behavior: 'smooth'}}), 300)</script>",
+            height="content",
+        )
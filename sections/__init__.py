@@ -0,0 +1,22 @@
+import importlib
+
+# Page title -> module in this package; each module defines a function of the same name
+PAGES = {
+    "Home": "home",
+    "Frontend": "frontend",
+    "Backend": "backend",
+    "Machine Learning": "machine_learning",
+    "Revenue Model": "revenue_model",
+    "FAQs": "faqs",
+    "Competition and Roadmap": "competition_and_roadmap",
+    "Get Involved": "get_involved",
+}
+
+
+# Pages are only imported when first selected
+def load_module(title):
+    return importlib.import_module(f"{__name__}.{PAGES[title]}")
+
+
+def load_page(title):
+    return getattr(load_module(title), PAGES[title])
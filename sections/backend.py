@@ -0,0 +1,75 @@
+from sections.render import render
+
+# Backend upload flow, drawn as an interactive graph on this page
+PIPELINE = {
+    "nodes": (
+        ("client", "Mobile / Web App", "Captures the incident photo and its location"),
+        ("websocket", "WebSocket Server", "Persistent connection for uploads and live severity updates"),
+        ("s3", "Amazon S3", "Stores the uploaded image"),
+        ("redis", "Redis Queue", "Holds the image URL, longitude and latitude until a worker picks it up"),
+        ("worker", "Worker", "Runs the machine learning models for each queued upload"),
+        ("yolo", "YOLOv9", "Severity score"),
+        ("gemini", "Google Gemini", "Incident description"),
+        ("postgres", "PostgreSQL (Prisma)", "Stores severity, description and location"),
+    ),
+    "edges": (
+        ("client", "websocket", "image + location"),
+        ("websocket", "s3", "image"),
+        ("websocket", "redis", "image URL, lat, long"),
+        ("redis", "worker", "job"),
+        ("worker", "yolo", "image"),
+        ("worker", "gemini", "image"),
+        ("yolo", "postgres", "severity"),
+        ("gemini", "postgres", "description"),
+        ("postgres", "client", "newsfeed"),
+    ),
+}
+
+CONTENT = (
+    ("title", "🚀 Backend - Suraksha"),
+    ("image", "Assets/Upload.jpg", "Upload Image"),
+    ("write", """
+        Suraksha's backend is the heart of our platform, powering the core functionality that enables real-time incident detection, severity assessment, and detailed incident reporting. Our backend is designed to handle a wide range of tasks, from processing user requests to managing machine learning models and interfacing with external services.
+
+        Here's an overview of the key components and features of Suraksha's backend:
+    """),
+    ("graph", PIPELINE, "Assets/Arch.jpg", "Backend Architecture Workflow"),
+    ("subheader", "🔧 Key Components of Suraksha's Backend"),
+    ("write", """
+    1. **WebSockets for Persistent Connection**: Suraksha's backend utilizes WebSockets to establish a persistent connection between the client (mobile or web) and the server, ensuring real-time communication for image uploads and location data.
+    
+    2. **Redis Queue**: When an image is uploaded, it is sent to a Redis queue. The Redis queue ensures that no upload is missed, efficiently managing the flow of data including the image URL, longitude, and latitude.
+    
+    3. **Frontend and Backend Synchronization**: The uploaded image is showcased both on the backend (for processing) and on the frontend (for user visualization) in real time, creating a seamless user experience.
+    
+    4. **Redis Queue Policies**: The Redis queue implements policies that trigger the next step in the flow by sending the data to a worker process for further processing.
+    
+    5. **Worker for ML Model Processing**: The worker runs machine learning models, including YOLOv9, which generate two key outputs: the severity score of the incident and an image description response.
+
+    6. **PostgreSQL Database with Prisma ORM**: Once the machine learning model generates the severity score and description, the results are saved to a PostgreSQL database. Prisma ORM is used for seamless database management, ensuring data integrity and efficient storage.
+
+    7. **End-to-End Real-Time System**: This entire backend flow allows Suraksha to efficiently handle real-time incident reporting, from image upload to severity analysis and data storage, all while ensuring that no crucial data is lost in the process.
+    """),
+    ("subheader", "🚀 Technologies Used in Suraksha's Backend"),
+    ("write", """
+    1. **TypeScript**: Suraksha's backend is built with TypeScript, ensuring type safety and scalability, making the codebase maintainable and efficient.
+    
+    2. **Redis**: Redis is used as a queue management system, ensuring that all image uploads, location data, and processing tasks are handled in an organized and reliable manner. It helps maintain smooth data flow and guarantees no post is missed.
+
+    3. **Prisma**: Prisma ORM facilitates seamless interaction between the backend and PostgreSQL database, ensuring efficient data queries, smooth migrations, and a simplified data management layer.
+
+    4. **PostgreSQL**: We use PostgreSQL as our primary database for storing incident data, including image descriptions, severity scores, and location details. PostgreSQL's robustness ensures data integrity and performance.
+
+    5. **WebSockets**: WebSockets provide a persistent connection between the client and server, enabling real-time data transfer, particularly for uploading images and receiving immediate responses about incident severity.
+
+    6. **Docker**: Docker is used for containerization, ensuring the consistency of the backend environment across different systems and simplifying deployment.
+
+    7. **Amazon EC2**: Amazon EC2 hosts Suraksha’s backend, providing scalable and secure compute capacity to run our server, machine learning models, and handle real-time incident data.
+
+    8. **Amazon S3**: Amazon S3 is used for storing uploaded images, and the image URLs are then referenced throughout the backend workflow. This ensures secure and scalable image storage with easy access to the images when needed.
+    """),
+)
+
+
+def backend():
+    render(CONTENT)
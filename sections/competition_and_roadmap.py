@@ -0,0 +1,54 @@
+from sections.render import render
+
+CONTENT = (
+    ("title", "🚀 Competition and Roadmap"),
+    ("subheader", "🌐 Competitive Landscape"),
+    ("write", "Suraksha is a pioneer in the field of incident detection and reporting. While there are several players in the market focused on traffic management and safety, Suraksha stands out with its unique blend of real-time incident recognition, severity assessment, and privacy-focused reporting. Here's how Suraksha distinguishes itself from competitors:"),
+    ("subheader", "🤼 Competitors"),
+    ("markdown", """
+    ### **1. MahaTrafficApp 🚓**
+    - **What They Do:** MahaTrafficApp allows citizens to report traffic violations by uploading images, which are then reviewed by authorities.
+    - **Edge Over Them:** While MahaTrafficApp focuses on traffic violations, Suraksha goes beyond by providing real-time incident detection and severity analysis. Additionally, our platform prioritizes user privacy, ensuring that personal details remain confidential and are only visible to authorities.
+
+    ### **2. Twitter 🚥**
+    - **What They Do:** Twitter is often used informally by the public to report road incidents and traffic incidents.
+    - **Edge Over Them:** Twitter’s reporting is scattered and lacks formal structure for monitoring and action. Suraksha, on the other hand, offers a centralized platform dedicated to incident detection, with a streamlined workflow for authorities to respond quickly and track the status of incidents.
+
+    ### **3. Google Maps Traffic 🚦**
+    - **What They Do:** Google Maps provides real-time traffic updates and incident reports based on user input and algorithms.
+    - **Edge Over Them:** While Google Maps is excellent for traffic updates, Suraksha specializes in detailed incident detection, severity scoring, and reporting. Our platform generates actionable insights for authorities and provides a more structured approach to incident management, with real-time notifications and detailed incident descriptions.
+
+    ### **4. Traffline 🛑**
+    - **What They Do:** Traffline offers real-time traffic updates and alerts for road conditions, including incidents.
+    - **Edge Over Them:** Traffline focuses on traffic updates, but Suraksha provides a more comprehensive solution with image-based incident detection and severity classification. Our platform not only informs users of incidents but also assists authorities in taking action, with updates on incident status and interventions.
+
+    ### **5. iSafe 🛡️**
+    - **What They Do:** iSafe is a safety app that focuses on personal safety, allowing users to report emergencies or unsafe situations.
+    - **Edge Over Them:** iSafe focuses on personal safety, whereas Suraksha is specialized in incident detection and road safety. With our detailed incident reports and real-time analysis, we offer a more targeted solution for all kinds of  incidents, along with an emphasis on privacy for reporters.
+    """),
+    ("subheader", "🗺️ Roadmap"),
+    ("write", "Suraksha is dedicated to continual innovation and expansion of its features. Here's a look at our roadmap for the platform:"),
+    ("markdown", """
+    - **Phase 1 (Current):**
+        - Real-time incident detection and severity classification
+        - Anonymous reporting with privacy safeguards
+        - Incident feed with real-time updates and action status from authorities
+    - **Phase 2 (Q3 2024):**
+        - Integration with government agencies and law enforcement for automated reporting
+        - Expansion to cover additional safety features like pedestrian incident detection
+        - Enhanced machine learning models for more accurate severity scoring
+    - **Phase 3 (Q1 2025):**
+        - Collaboration with insurance companies for automated claims processing
+        - Introduction of AI-driven analytics for identifying incident-prone areas
+        - Expansion of Suraksha to international markets
+    - **Phase 4 (Q3 2025):**
+        - Integration with emergency services for real-time dispatch and tracking
+        - Advanced analytics for road safety and traffic management
+        - Public-facing dashboards for road safety awareness and incident data insights
+    """),
+    ("write", "Suraksha is committed to pushing the boundaries of incident detection and reporting, continuously improving the platform to better serve users and authorities. Together, we aim to make roads safer and more secure for everyone. 🌟"),
+)
+
+
+def competition_and_roadmap():
+    render(CONTENT)
@@ -0,0 +1,44 @@
+import json
+
+import streamlit as st
+
+import metrics
+from assets import cache_stats
+
+
+# Reached with ?diagnostics in the URL when SURAKSHA_METRICS=1; not listed in the sidebar
+def diagnostics():
+    st.title("🩺 Diagnostics")
+
+    snapshot = metrics.get_metrics().snapshot()
+    st.metric("Sessions", snapshot["sessions"])
+
+    rows = [
+        {
+            "Page": page,
+            "Renders": stats["renders"],
+            "Mean render (ms)": round(1000 * stats["render_seconds"] / stats["renders"], 1),
+            "Images": stats["images"],
+            "Image time (ms)": round(1000 * stats["image_seconds"], 1),
+            "Media sent (KB)": round(stats["media_bytes"] / 1024, 1),
+            "Sessions": stats["sessions"],
+        }
+        for page, stats in sorted(snapshot["pages"].items(), key=lambda item: -item[1]["render_seconds"])
+    ]
+    st.subheader("Pages")
+    st.dataframe(rows)
+
+    st.subheader("Asset cache")
+    st.json(cache_stats())
+
+    text = metrics.prometheus_text(snapshot, cache_stats())
+    st.subheader("Prometheus")
+    st.download_button("Download metrics", text, file_name="metrics.prom", mime="text/plain")
+    st.code(text, language="text")
+
+    st.download_button(
+        "Download JSON",
+        json.dumps({"pages": snapshot, "asset_cache": cache_stats()}, indent=2),
+        file_name="metrics.json",
+        mime="application/json",
+    )
@@ -0,0 +1,41 @@
+from sections.render import render
+
+CONTENT = (
+    ("title", "❓ FAQs"),
+    ("subheader", "Q1: How does Suraksha ensure user privacy when reporting incidents?"),
+    ("write", "🔐 Suraksha prioritizes user privacy by implementing anonymous reporting. Your personal information is kept confidential and only accessible to the appropriate authorities, ensuring that your identity remains protected while still allowing critical information to be shared for timely responses."),
+    ("subheader", "Q2: How does the incident severity detection work?"),
+    ("write", "🛡️ Suraksha uses advanced machine learning models to analyze incident images in real time. The model determines the severity of the incident based on key visual indicators, categorizing it as either 'moderate' or 'severe.' This enables authorities to allocate resources efficiently."),
+    ("subheader", "Q3: Which areas does Suraksha currently cover?"),
+    ("write", "🌍 Suraksha is currently available across multiple cities in India, with plans to expand to other regions. The platform’s scalability ensures that as we expand, we maintain the same level of efficiency and accuracy in incident reporting."),
+    ("subheader", "Q4: How does Suraksha notify authorities in real time?"),
+    ("write", "🔔 Suraksha has an integrated notification system that instantly alerts local authorities when an incident is detected. The system sends real-time updates, including incident location and severity details, ensuring quick response times."),
+    ("subheader", "Q5: What happens if a minor tries to report an incident?"),
+    ("write", "🚫 Suraksha restricts minors from reporting incidents independently. However, they can still provide information to a verified guardian or responsible adult who can submit the report on their behalf, ensuring both safety and legal compliance."),
+    ("subheader", "Q6: How does Suraksha handle false reports?"),
+    ("write", "🔄 Suraksha employs AI-driven algorithms to verify reports before alerting authorities. If a report is flagged as suspicious, it undergoes further review to reduce false alarms and ensure only legitimate incidents are prioritized."),
+    ("subheader", "Q7: What sets Suraksha apart from other incident reporting platforms?"),
+    ("write", "✨ Suraksha is unique due to its real-time incident detection, detailed severity analysis, and privacy-first approach to reporting. Unlike other platforms, we provide actionable data to authorities and ensure user privacy is never compromised."),
+    ("subheader", "Q8: Can Suraksha integrate with emergency response systems?"),
+    ("write", "🔗 Absolutely! Suraksha is designed to integrate seamlessly with existing emergency response systems, helping authorities receive real-time updates and enabling faster decision-making during critical incidents."),
+    ("subheader", "Q9: How does Suraksha ensure accurate incident severity predictions?"),
+    ("write", "📊 Suraksha uses a highly trained machine learning model that has been tested on thousands of real-world incident images. This allows for accurate categorization of incidents based on visual data and contextual clues, ensuring precise severity classification."),
+    ("subheader", "Q10: Is Suraksha compatible with mobile devices?"),
+    ("write", "📱 Yes, Suraksha is fully optimized for mobile devices. Whether you are using a smartphone or tablet, you can easily report incidents, view severity predictions, and receive notifications from the platform in real time."),
+    ("subheader", "Q11: How quickly are authorities notified after an incident is detected?"),
+    ("write", "⏱️ Suraksha sends notifications to authorities within seconds of detecting an incident. The platform’s real-time alert system ensures that no time is wasted, allowing for prompt action to be taken."),
+    ("subheader", "Q12: Can users track the status of their reports?"),
+    ("write", "📍 Yes, once an incident is reported through Suraksha, users can track the status of their report, including when it has been reviewed and when authorities are responding. This transparency ensures users are kept in the loop throughout the process."),
+    ("subheader", "Q13: What kind of images can be uploaded for incident detection?"),
+    ("write", "📸 Suraksha accepts images taken directly from mobile devices or other cameras at the scene of the incident. The clearer the image, the more accurate the incident severity prediction, although the model is robust enough to handle varying image quality."),
+    ("subheader", "Q14: How does Suraksha handle user data and ensure compliance with data protection laws?"),
+    ("write", "🛡️ Suraksha is fully compliant with local data protection laws, including India’s IT Act. We take user privacy seriously, and all data collected is securely stored, encrypted, and only shared with authorized personnel to facilitate quick responses."),
+    ("subheader", "Q15: What if I’m unsure about the severity of an incident?"),
+    ("write", "🤔 No worries! Suraksha automatically analyzes the incident image you provide and gives an accurate prediction of the severity level. This helps guide your report and ensures the right level of urgency is assigned to the case."),
+    ("subheader", "Q16: Can I report incidents outside of my local area?"),
+    ("write", "🌏 Yes, Suraksha allows you to report incidents regardless of your physical location. Whether you're traveling or simply passing through another area, you can still report an incident, and local authorities will be notified."),
+)
+
+
+def faqs():
+    render(CONTENT)
@@ -0,0 +1,49 @@
+from sections.render import render
+
+CONTENT = (
+    ("title", "🚀 Frontend - Suraksha"),
+    ("image", "Assets/Login.jpg", "Web Interface Login/Signup"),
+    ("write", """
+        Suraksha’s frontend is designed to ensure a user-friendly experience across both our mobile application and web interface. Whether it’s reporting incidents, tracking updates, or managing privacy, the frontend is built with modern technologies to provide seamless interaction and real-time responsiveness for all users.
+
+        Here's an overview of the key components and features of Suraksha's frontend:
+    """),
+    ("image", "Assets/Dashboard.jpg", "Web Interface Dashboard"),
+    ("subheader", "🔧 Key Components of Suraksha's Frontend"),
+    ("write", """
+    1. **Mobile and Web Interface**: Suraksha offers both a mobile application and a web interface, ensuring accessibility across multiple platforms. Users can create posts and access incident data from either platform, with a consistent experience on both.
+
+    2. **Social Media-Style Feed**: Both the mobile app and web interface feature a dynamic news feed where posts about accidents appear in real time. Each post, similar to a social media card, includes the uploaded image, severity score, description, and location of the incident, ensuring civilians and authorities have up-to-date information.
+
+    3. **Real-Time Post Updates**: Incident posts are updated in real time with the latest information, including whether action has been taken by authorities. Users can follow the progress of each reported accident directly from the feed.
+
+    4. **Incident Dashboard**: The web interface includes a dedicated dashboard for users to view their incident history, including the number of incidents reported and how many have been resolved. This feature offers a bird’s-eye view of a user's contribution to public safety.
+    """),
+    ("image", "Assets/News1.jpg", "Web Interface Newsfeed"),
+    ("write", """         
+    5. **Real-Time Image and Location Sharing**: Every post includes a real-time image of the accident, along with its exact location, description, and severity score. This information is made available to both civilians and authorities, enabling quick responses.
+
+    6. **Status Updates on Incidents**: Each post reflects the current status of the incident, indicating whether any action has been taken. Authorities have an admin dashboard where they can update the status of incidents, ensuring transparency and timely responses.
+
+    7. **Action Tracking by Authorities**: A dedicated section is available for tracking actions taken by authorities in response to the reported incidents. Users can see detailed updates regarding measures taken to resolve accidents.
+
+    8. **Privacy Controls for Incident Reporting**: To protect user anonymity, names of individuals reporting incidents are not displayed publicly on the feed but are visible to authorities. This ensures that privacy concerns are respected while enabling critical information sharing.
+    """),
+    ("image", "Assets/Mob.jpg", "Mobile App Newsfeed", 300),
+    ("subheader", "🚀 Technologies Used in Suraksha's Frontend"),
+    ("write", """
+    1. **Next.js**: Suraksha's frontend leverages Next.js, a React-based framework, to build a highly responsive and fast web interface. Its server-side rendering and static site generation features enhance performance, ensuring a seamless user experience on both mobile and web platforms.
+
+    2. **Ant Design**: Ant Design is used as the UI framework for Suraksha, providing a clean, intuitive, and responsive design. It allows for building sophisticated components that enhance the look and feel of both the mobile and web interfaces, ensuring a user-friendly experience.
+
+    3. **Redux Toolkit**: Redux Toolkit is employed for state management, ensuring Suraksha's frontend maintains a consistent and predictable state across components. This simplifies handling complex data flows and enables efficient management of real-time updates and posts.
+
+    4. **Framer Motion**: Framer Motion is used to add animations and interactions to the frontend, creating a dynamic and engaging user experience. From smooth transitions to interactive elements, it helps bring the platform to life.
+
+    5. **TypeScript**: TypeScript is the primary language used in Suraksha’s frontend, adding type safety and scalability to the codebase. It ensures code maintainability, reduces errors, and improves overall development efficiency.
+    """),
+)
+
+
+def frontend():
+    render(CONTENT)
@@ -0,0 +1,33 @@
+import streamlit as st
+
+from sections.render import render
+
+CONTENT = (
+    ("title", "🌟 Get Involved with Suraksha"),
+    ("subheader", "🤝 Contribute to Suraksha"),
+    ("write", "We welcome contributions from the community to help shape the future of Suraksha. Here’s how you can get involved and make an impact:"),
+    ("markdown", """
+    1. **Fork the Repository**: Click the "Fork" button on the [Suraksha GitHub repository](https://github.com/snehalsaurabh/Suraksha) to create your own copy of the project. 🍴
+    2. **Clone Your Fork**: Clone the repository to your local machine using:
+    ```bash
+    git clone https://github.com/snehalsaurabh/Suraksha
+    ```
+    🖥️
+    3. **Set Up Development Environment**: Navigate to the project directory and install dependencies:
+    ```bash
+    cd Suraksha
+    npm install
+    ```
+    ⚙️
+    4. **Make Changes**: Create a new branch, make your changes, and commit them. ✏️
+    5. **Submit a Pull Request**: Push your changes to your fork and submit a pull request to contribute your improvements. 🔄
+    """),
+    ("write", "We're excited to see your contributions! Thank you for being a part of the Suraksha community. 🙌"),
+)
+
+
+def get_involved():
+    render(CONTENT)
+
+    if st.button("Visit GitHub Repository"):
+        st.markdown('<a href="https://github.com/snehalsaurabh/Suraksha" target="_blank">Suraksha GitHub Repository</a>', unsafe_allow_html=True)
@@ -0,0 +1,60 @@
+import streamlit as st
+
+ROW_SPACING = 100
+NODE_SPACING = 220
+GRAPH_WIDTH = 704
+NODE_STYLE = {"shape": "box", "color": "#F7A7A6", "font": {"size": 16}, "margin": 10}
+
+
+# Computed once per spec and shared by every session and rerun; the result is plain JSON data
+@st.cache_data
+def layout(spec):
+    nodes = {node_id: (label, title) for node_id, label, title in spec["nodes"]}
+    targets = {node_id: [] for node_id in nodes}
+    for source, target, _ in spec["edges"]:
+        targets[source].append(target)
+
+    # Layered top-to-bottom: each node sits one row below the closest node feeding into it
+    root = spec["nodes"][0][0]
+    rows = {root: 0}
+    queue = [root]
+    for node_id in queue:
+        for target in targets[node_id]:
+            if target not in rows:
+                rows[target] = rows[node_id] + 1
+                queue.append(target)
+
+    members = {}
+    for node_id in nodes:
+        members.setdefault(rows.get(node_id, len(nodes)), []).append(node_id)
+
+    payload_nodes = []
+    for row, row_nodes in sorted(members.items()):
+        offset = (len(row_nodes) - 1) * NODE_SPACING / 2
+        for i, node_id in enumerate(row_nodes):
+            label, title = nodes[node_id]
+            payload_nodes.append({
+                "id": node_id,
+                "label": label,
+                "title": title,
+                "x": round(i * NODE_SPACING - offset),
+                "y": row * ROW_SPACING,
+            })
+
+    payload_edges = [
+        {"source": source, "target": target, "label": label}
+        for source, target, label in spec["edges"]
+    ]
+    return {"nodes": payload_nodes, "edges": payload_edges, "height": (len(members) + 1) * ROW_SPACING}
+
+
+def show_graph(spec, caption=None):
+    # Only pulled in on pages that actually draw a graph
+    from streamlit_agraph import Config, Edge, Node, agraph
+
+    payload = layout(spec)
+    nodes = [Node(**node, **NODE_STYLE) for node in payload["nodes"]]
+    edges = [Edge(**edge) for edge in payload["edges"]]
+    agraph(nodes=nodes, edges=edges, config=Config(width=GRAPH_WIDTH, height=payload["height"], physics=False))
+    if caption:
+        st.caption(caption)
@@ -0,0 +1,41 @@
+from sections.render import render
+
+CONTENT = (
+    ("title", "🚀 Welcome to Suraksha! - The Official Documentation"),
+    ("write", """
+        **Suraksha** is an innovative platform designed to address a critical issue: the high rate of incidents like road accidents, physical crime and more in India. For example, every day, over 1,200 road incidents occur, leading to numerous injuries and fatalities. Suraksha provides a comprehensive solution for recognizing, monitoring, and reporting all kinds of  incidents in real time, making it easier for both authorities and civilians to respond swiftly and effectively.
+
+        Our platform leverages advanced technology to detect and analyze incidents, offering valuable insights that enhance emergency response and road safety management. Here’s how Suraksha can transform incident management:
+    """),
+    ("image", "Assets/Suraksha.png", "Suraksha"),
+    ("subheader", "🔍 Key Features of Suraksha"),
+    ("write", """
+        - **Real-Time incident Detection**: Instantly identify all kinds of incidents through images, allowing for prompt response and intervention.
+        - **Severity Assessment**: Evaluate the seriousness of each incident to prioritize emergency services effectively.
+        - **Detailed Incident Descriptions**: Receive comprehensive explanations of the incident context to better understand the situation.
+        - **User-Friendly Interface**: Enjoy an intuitive interface that simplifies incident reporting and management for all users.
+        - **Location-Based Services**: Access location-specific data to streamline emergency response and resource allocation.
+        - **Actionable Insights**: Receive actionable insights and recommendations to guide decision-making and response strategies.
+    """),
+    ("subheader", "🚗 Product Workflow"),
+    ("write", """
+        Here’s how Suraksha works:
+
+        1. **Upload an Image**: When an incident occurs, you can capture a photo with your phone and upload it through the Suraksha app.
+        2. **Analysis and Detection**: Our platform analyzes the image using machine learning models to detect the incident and assess its severity.
+        3. **Generate Incident Description**: Our system provides a detailed description of the incident, giving a clear understanding of the situation.
+        4. **Actionable Insights**: Get actionable insights and updates to guide emergency response and decision-making processes.
+
+        Whether you’re a passerby or an emergency responder, Suraksha helps ensure that every incident is promptly and accurately reported.
+    """),
+    ("subheader", "🔗 Get Started"),
+    ("write", """
+        Ready to make a difference? Start using Suraksha to experience how our cutting-edge technology can enhance your incident management processes and improve public safety.
+
+        Explore our features and see how Suraksha can support your efforts in managing and responding to incidents!
+    """),
+)
+
+
+def home():
+    render(CONTENT)
@@ -0,0 +1,989 @@
+from sections.render import render
+
+CONTENT = (
+    ("title", "🧠 Machine Learning - Suraksha"),
+    ("image", "Assets/Suraksha.jpg", "Suraksha ML Models"),
+    ("subheader", "🚀 Overview of Machine Learning Models in Suraksha"),
+    ("write", """
+        Suraksha utilizes cutting-edge machine learning models to ensure accurate incident detection and context understanding. 
+        Our application integrates two distinct models:
+        
+        1. **YOLOv9 Pre-Trained Model**: This model has been fine-tuned on our custom dataset comprising over 1200+ images. 
+           It provides a severity score for incidents based on the uploaded image, helping gauge the level of urgency required for each situation.
+        
+        2. **Google Gemini Model**: Leveraging the power of Google's Gemini Model, a detailed description is generated, providing a comprehensive context 
+           of the incident depicted in the image. This ensures that not only the severity but the full context of the event is understood.
+    """),
+    ("image", "Assets/YoloV9.jpeg", "Model 1: YOLOv9"),
+    ("subheader", "🔍 How the YOLOv9 Model Works"),
+    ("write", """
+        Our first model is based on the YOLOv9 architecture, specifically fine-tuned for incident severity detection. Let's break down its core features and functionality:
+
+        - **Fine-Tuning**: The YOLOv9 model has been meticulously fine-tuned using a specialized dataset of over 1200+ incident images. By adjusting the weights and optimizing the learning parameters, we have trained the model to recognize and classify the severity of all kinds of  incidents with a high degree of accuracy.
+        
+        - **Severity Scoring**: Upon processing an image, the model generates a severity score that classifies the detected incidents. The severity can range from minor (low impact) to severe (high impact), helping decision-makers quickly gauge the criticality of the incident.
+        
+        - **Real-Time Inference**: One of the strongest features of the YOLO (You Only Look Once) family of models, including YOLOv9, is its ability to perform real-time inference. This means that the model can quickly process images and return accurate results in a matter of milliseconds, making it an ideal tool for real-world applications where timely responses are crucial.
+
+        Below is a sample Python code demonstrating how we can use the YOLOv9 model for incident severity detection:
+    """),
+    ("code", """
+    import argparse
+    import os
+    import torch
+    from pathlib import Path
+    from collections import Counter
+    from models.common import DetectMultiBackend
+    from utils.dataloaders import LoadImages
+    from utils.general import non_max_suppression, LOGGER
+
+    def run(weights='yolo.pt', source='data/images', conf_thres=0.25, iou_thres=0.45):
+        # Load model
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        model = DetectMultiBackend(weights, device=device)
+        
+        # Load images
+        dataset = LoadImages(source)
+        
+        class_counter = Counter()  # Class occurrence counter
+        
+        # Run inference
+        for path, im, im0s, s in dataset:
+            im = torch.from_numpy(im).to(device).float() / 255.0  # Preprocessing
+            pred = model(im)  # Model inference
+            det = non_max_suppression(pred, conf_thres, iou_thres)
+            
+            # Count detected classes
+            for *xyxy, conf, cls in reversed(det):
+                class_counter[model.names[int(cls)]] += 1
+
+        most_common_class = class_counter.most_common(1)[0][0] if class_counter else "No_incident"
+        LOGGER.info(f"Detected class: {most_common_class}")
+    """, "python"),
+    ("write", """
+    ### Code Breakdown and Explanation:
+
+    1. **Imports**:
+        - **argparse**: Helps with parsing command-line arguments (though unused in this snippet, useful for expanding the script).
+        - **os**: Provides interaction with the operating system (to manipulate paths, directories, etc.).
+        - **torch**: This is the main PyTorch library, used for loading the model, handling tensors, and running the model on either CPU or GPU.
+        - **pathlib.Path**: A more Pythonic way to handle paths and directories.
+        - **collections.Counter**: A utility to count occurrences of incident classes predicted by the model.
+        - **DetectMultiBackend**: This is a YOLOv9-specific utility that loads and handles the model for inference.
+        - **LoadImages**: A YOLO utility to load images for inference.
+        - **non_max_suppression**: A critical function that helps remove redundant bounding boxes based on Intersection over Union (IoU) thresholds.
+        - **LOGGER**: A logging utility to display useful information about the inference process.
+
+    2. **`run` function**:
+        This function is where the core inference happens. It takes in several arguments:
+        - `weights`: The path to the trained YOLOv9 model weights (e.g., `best.pt`).
+        - `source`: The path where the images to be processed are located.
+        - `conf_thres`: The confidence threshold—any prediction below this value is discarded.
+        - `iou_thres`: The Intersection over Union threshold for non-max suppression, controlling how overlapping predictions are handled.
+
+    3. **Model Loading**:
+        ```python
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        model = DetectMultiBackend(weights, device=device)
+        ```
+        The model is loaded into the appropriate device (GPU if available, otherwise CPU). Using the GPU can significantly speed up inference, especially for large-scale real-time image processing.
+
+    4. **Image Loading**:
+        ```python
+        dataset = LoadImages(source)
+        ```
+        This line sets up the image loader. It reads images from the [`source`](command:_github.copilot.openSymbolFromReferences?%5B%22%22%2C%5B%7B%22uri%22%3A%7B%22scheme%22%3A%22file%22%2C%22authority%22%3A%22%22%2C%22path%22%3A%22%2FD%3A%2FProjects%2FSurakshaV2%2FDocumentation%2Fapp.py%22%2C%22query%22%3A%22%22%2C%22fragment%22%3A%22%22%7D%2C%22pos%22%3A%7B%22line%22%3A104%2C%22character%22%3A33%7D%7D%5D%2C%22dcd69879-541f-4f72-9523-83961bb0a4f7%22%5D "Go to definition") directory for inference. The [`LoadImages`](command:_github.copilot.openSymbolFromReferences?%5B%22%22%2C%5B%7B%22uri%22%3A%7B%22scheme%22%3A%22file%22%2C%22authority%22%3A%22%22%2C%22path%22%3A%22%2FD%3A%2FProjects%2FSurakshaV2%2FDocumentation%2Fapp.py%22%2C%22query%22%3A%22%22%2C%22fragment%22%3A%22%22%7D%2C%22pos%22%3A%7B%22line%22%3A84%2C%22character%22%3A16%7D%7D%5D%2C%22dcd69879-541f-4f72-9523-83961bb0a4f7%22%5D "Go to definition") utility ensures that images are preprocessed correctly before being fed into the model.
+
+    5. **Running Inference**:
+        ```python
+        for path, im, im0s, s in dataset:
+            im = torch.from_numpy(im).to(device).float() / 255.0
+            pred = model(im)
+            det = non_max_suppression(pred, conf_thres, iou_thres)
+        ```
+        This section processes each image, performs inference, and applies non-max suppression to filter out redundant predictions.
+
+    6. **Counting Detected Classes**:
+        ```python
+        for *xyxy, conf, cls in reversed(det):
+            class_counter[model.names[int(cls)]] += 1
+        ```
+        Detected classes are counted using the `Counter` utility. The most frequently detected class is considered the primary result.
+
+    7. **Logging**:
+        ```python
+        most_common_class = class_counter.most_common(1)[0][0] if class_counter else "No_incident"
+        LOGGER.info(f"Detected class: {most_common_class}")
+        ```
+        Finally, the most common class detected across all images is logged.
+
+    For a more comprehensive look into YOLOv9, including model architecture and training techniques, refer to the official documentation and research papers.
+    """),
+    ("subheader", "⚡ Batched Inference for the Worker"),
+    ("write", """
+        The `run` function above handles one image at a time, which is fine for trying the model out. Our worker, however, drains a queue of uploads, and on CPU-only machines processing those images one by one leaves most of the hardware idle.
+        The batched version below keeps the same model and thresholds but processes several uploads per forward pass:
+    """),
+    ("code", """
+    import cv2
+    import numpy as np
+    import itertools
+    import torch
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from models.common import DetectMultiBackend
+    from utils.augmentations import letterbox
+    from utils.general import non_max_suppression, LOGGER
+
+    def load_image(path, imgsz):
+        im0 = cv2.imread(str(path))  # BGR
+        im = letterbox(im0, imgsz, auto=False)[0]  # Same size for every image so they can be stacked
+        return np.ascontiguousarray(im.transpose((2, 0, 1))[::-1])  # HWC to CHW, BGR to RGB
+
+    def next_batch(pending, max_batch):
+        # Wait for the oldest image, then take every image that is already decoded
+        batch = [pending.popleft()]
+        batch[0].result()
+        while pending and len(batch) < max_batch and pending[0].done():
+            batch.append(pending.popleft())
+        return batch
+
+    def run_batched(weights='yolo.pt', sources=(), imgsz=640, max_batch=16, workers=4, conf_thres=0.25, iou_thres=0.45):
+        # Load model
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        model = DetectMultiBackend(weights, device=device)
+        num_classes = len(model.names)
+
+        # Input buffer allocated once and reused for every batch
+        buffer = torch.empty((max_batch, 3, imgsz, imgsz), dtype=torch.uint8, pin_memory=device.type == 'cuda')
+
+        sources = iter(sources)  # Any iterable, e.g. a generator that drains the upload queue
+        paths, results = [], []  # Most common class per source, in order
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            while True:
+                # Decode and letterbox in the background while the model is busy, at most two batches ahead
+                for path in itertools.islice(sources, 2 * max_batch - len(pending)):
+                    paths.append(path)
+                    pending.append(pool.submit(load_image, path, imgsz))
+                if not pending:
+                    break
+
+                batch = next_batch(pending, max_batch)
+                for i, future in enumerate(batch):
+                    buffer[i].copy_(torch.from_numpy(future.result()))
+
+                im = buffer[:len(batch)].to(device, non_blocking=True).float() / 255.0  # Preprocessing
+                pred = model(im)  # One forward pass for the whole batch
+                dets = non_max_suppression(pred, conf_thres, iou_thres)  # One tensor per image
+
+                # Count classes for every image in the batch at once
+                image_idx = torch.cat([torch.full((len(det),), i) for i, det in enumerate(dets)])
+                classes = torch.cat(dets)[:, 5].long().cpu()
+                counts = torch.zeros((len(batch), num_classes), dtype=torch.long)
+                counts.index_put_((image_idx, classes), torch.ones_like(classes), accumulate=True)
+
+                for row in counts:
+                    results.append(model.names[int(row.argmax())] if row.any() else "No_incident")
+
+        for path, most_common_class in zip(paths, results):
+            LOGGER.info(f"{path}: detected class {most_common_class}")
+        return results
+    """, "python"),
+    ("write", """
+    ### What Changes Compared to `run`:
+
+    1. **Background Decoding**:
+        ```python
+        for path in itertools.islice(sources, 2 * max_batch - len(pending)):
+            pending.append(pool.submit(load_image, path, imgsz))
+        ```
+        Reading and letterboxing images happens on a thread pool, so the next batch is usually decoded by the time the model finishes the current one. `letterbox(..., auto=False)` pads every image to the same `imgsz` square, which is what allows them to be stacked into one tensor.
+        At most two batches are decoded ahead of the model, so memory stays the same however long the queue is: a decoded 640×640 image takes about 1.2 MB.
+
+    2. **Dynamic Batch Size**:
+        ```python
+        batch = next_batch(pending, max_batch)
+        ```
+        The worker always waits for the oldest image, then adds every image that is already decoded, up to `max_batch`. Under a burst of uploads batches fill up; when traffic is light a single image is processed straight away instead of waiting for a full batch.
+
+    3. **Preallocated Input Buffer**:
+        ```python
+        buffer = torch.empty((max_batch, 3, imgsz, imgsz), dtype=torch.uint8, pin_memory=device.type == 'cuda')
+        ```
+        The batch tensor is allocated once and filled in place, instead of creating a new tensor for every image. On a GPU the buffer is pinned so the copy to the device can run asynchronously.
+
+    4. **Vectorized Class Counting**:
+        ```python
+        counts.index_put_((image_idx, classes), torch.ones_like(classes), accumulate=True)
+        ```
+        Instead of looping over every detection in Python, all detections of the batch are counted with a single tensor operation, giving one row of class counts per image. The most common class of each row is that image's result, exactly like `most_common(1)` in `run`.
+    """),
+    ("subheader", "🔥 Keeping the Model Loaded"),
+    ("write", """
+        Both `run` and `run_batched` create a new `DetectMultiBackend` on every call, so the weights are read from disk and the model is rebuilt each time. In a long-running worker the model only needs to be loaded once per process.
+        The snippet below keeps one warmed-up model per weights file and shares it with every worker process:
+    """),
+    ("code", """
+    import gc
+    import multiprocessing
+    import resource
+    import time
+    import torch
+    from functools import lru_cache
+    from models.common import DetectMultiBackend
+    from utils.general import LOGGER
+
+    def get_model(weights='yolo.pt', device='cpu', imgsz=640):
+        # lru_cache keys on how the arguments were passed, so the cached call always gets all three, positionally
+        return load_model(str(weights), str(device), int(imgsz))
+
+    @lru_cache(maxsize=None)
+    def load_model(weights, device, imgsz):
+        start = time.perf_counter()
+        model = DetectMultiBackend(weights, device=torch.device(device))
+        with torch.no_grad():
+            # Dummy forward pass; model.warmup() skips it on CPU, which is where our workers run
+            model(torch.zeros((1, 3, imgsz, imgsz), device=torch.device(device)))
+        load_time = time.perf_counter() - start
+
+        model_bytes = sum(t.numel() * t.element_size() for t in (*model.parameters(), *model.buffers()))
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports KB
+        LOGGER.info(f"Loaded {weights} in {load_time:.2f}s ({model_bytes / 1e6:.1f} MB of weights, {rss_mb:.0f} MB peak RSS)")
+        return model
+
+    def start_workers(worker_loop, weights='yolo.pt', num_workers=4):
+        torch.set_grad_enabled(False)  # Inference only
+        get_model(weights)  # Load and warm up once, in the parent process
+
+        # Stop the garbage collector from touching, and therefore copying, the model's memory pages
+        gc.freeze()
+
+        ctx = multiprocessing.get_context('fork')
+        workers = [ctx.Process(target=worker_loop, args=(weights,)) for _ in range(num_workers)]
+        for worker in workers:
+            worker.start()
+        return workers
+    """, "python"),
+    ("write", """
+    ### How It Works:
+
+    1. **One Model per Weights File**:
+        ```python
+        return load_model(str(weights), str(device), int(imgsz))
+        ```
+        The first call loads the model and every later call with the same weights, device and image size returns the same object. `lru_cache` treats `get_model(weights)` and `get_model(weights, 'cpu')` as different keys, so `get_model` fills in the defaults before calling the cached `load_model`; however it is called, the model is only loaded once. Inside `run` or `run_batched`, `model = get_model(weights, device.type, imgsz)` replaces the `DetectMultiBackend(...)` line.
+
+    2. **Warm-Up**:
+        ```python
+        with torch.no_grad():
+            model(torch.zeros((1, 3, imgsz, imgsz), device=torch.device(device)))
+        ```
+        A dummy forward pass runs right after loading, so the one-off setup cost is paid before the first real upload arrives rather than by it. YOLOv9's own `model.warmup()` does nothing on CPU, so the pass is run explicitly.
+
+    3. **Shared Across Worker Processes**:
+        ```python
+        get_model(weights)
+        gc.freeze()
+        ctx = multiprocessing.get_context('fork')
+        ```
+        The parent loads the model before forking, so every worker starts with the model already in memory. Forked processes share those pages copy-on-write, and as long as the weights are only read they are never copied. `gc.freeze()` keeps the garbage collector from writing to the objects that hold the model.
+
+    4. **Load Time and Memory Footprint**:
+        ```python
+        LOGGER.info(f"Loaded {weights} in {load_time:.2f}s ({model_bytes / 1e6:.1f} MB of weights, {rss_mb:.0f} MB peak RSS)")
+        ```
+        Every load is logged with how long it took and how much memory the weights take, which makes slow restarts easy to spot.
+    """),
+    ("subheader", "🗜️ Quantized Model for CPU Workers"),
+    ("write", """
+        Our workers run on CPU only, where `run` falls back to the full-precision PyTorch weights. Converting the fine-tuned model to ONNX and quantizing it to 8-bit integers usually makes CPU inference noticeably faster, at the cost of a small change in the model's outputs.
+        The first step uses the export script that ships with the YOLOv9 repository (`--dynamic` keeps the batch size flexible for `run_batched`):
+    """),
+    ("code", """
+    python export.py --weights best.pt --include onnx --imgsz 640 --dynamic
+    """, "bash"),
+    ("write", """
+        The ONNX model is then quantized using a few hundred of our own incident images for calibration, and checked against the original model on a separate held-out set before the worker is allowed to use it:
+    """),
+    ("code", """
+    import hashlib
+    import json
+    import time
+    import numpy as np
+    import torch
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+    from utils.general import non_max_suppression, LOGGER
+
+    REPORT_PATH = 'quantization_report.json'
+
+    class ImageReader(CalibrationDataReader):
+        def __init__(self, paths, imgsz=640):
+            self.paths = iter(paths)
+            self.imgsz = imgsz
+
+        def get_next(self):
+            path = next(self.paths, None)
+            if path is None:
+                return None
+            return {'images': load_image(path, self.imgsz)[None].astype(np.float32) / 255.0}
+
+    def quantize(fp32_model='best.onnx', int8_model='best-int8.onnx', calibration_images=()):
+        quant_pre_process(fp32_model, 'best-prep.onnx')
+        quantize_static(
+            'best-prep.onnx', int8_model, ImageReader(calibration_images),
+            quant_format=QuantFormat.QDQ, activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8,
+            per_channel=True,
+        )
+
+    def predict(model, image, conf_thres=0.25, iou_thres=0.45):
+        im = torch.from_numpy(image)[None].float() / 255.0
+        det = non_max_suppression(model(im), conf_thres, iou_thres)[0]
+        if not len(det):
+            return "No_incident"
+        return model.names[int(torch.bincount(det[:, 5].long()).argmax())]
+
+    def file_hash(path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def validate(float_weights='best.pt', int8_weights='best-int8.onnx', holdout_images=()):
+        report, predictions = {}, {}
+        images = [load_image(path, 640) for path in holdout_images]  # Decoded once, outside the timed part
+        for name, weights in (('float', float_weights), ('int8', int8_weights)):
+            model = get_model(weights)
+            latencies, predictions[name] = [], []
+            for image in images:
+                start = time.perf_counter()
+                predictions[name].append(predict(model, image))
+                latencies.append(time.perf_counter() - start)
+            report[name] = {
+                'weights': weights,
+                'sha256': file_hash(weights),  # The report only holds for these exact files
+                'mean_ms': 1000 * float(np.mean(latencies)),
+                'p95_ms': 1000 * float(np.percentile(latencies, 95)),
+            }
+
+        agree = [a == b for a, b in zip(predictions['float'], predictions['int8'])]
+        report['images'] = len(agree)
+        report['agreement'] = float(np.mean(agree))  # Share of images where both models give the same class
+        report['speedup'] = report['float']['mean_ms'] / report['int8']['mean_ms']
+        with open(REPORT_PATH, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def pick_weights(float_weights='best.pt', int8_weights='best-int8.onnx', min_agreement=0.98):
+        try:
+            with open(REPORT_PATH) as f:
+                report = json.load(f)
+        except FileNotFoundError:
+            return float_weights
+        try:
+            changed = report['float']['sha256'] != file_hash(float_weights) or report['int8']['sha256'] != file_hash(int8_weights)
+        except FileNotFoundError:
+            LOGGER.warning(f"Not using {int8_weights}: file not found")
+            return float_weights
+        if changed:
+            LOGGER.warning(f"Not using {int8_weights}: {REPORT_PATH} was made for different weights, run validate() again")
+            return float_weights
+        if report['agreement'] >= min_agreement and report['speedup'] > 1:
+            return int8_weights
+        LOGGER.warning(f"Not using {int8_weights}: agreement {report['agreement']:.1%}, speedup {report['speedup']:.2f}x")
+        return float_weights
+    """, "python"),
+    ("write", """
+    ### How It Works:
+
+    1. **Calibration**:
+        ```python
+        quantize_static('best-prep.onnx', int8_model, ImageReader(calibration_images), ...)
+        ```
+        Static quantization runs the model on sample images to learn the value ranges of every layer, then stores weights and activations as 8-bit integers. The calibration images go through the same `load_image` letterboxing as in production, so the learned ranges match what the worker will see.
+
+    2. **Accuracy vs. Latency Report**:
+        ```python
+        report['agreement'] = float(np.mean(agree))
+        report['speedup'] = report['float']['mean_ms'] / report['int8']['mean_ms']
+        ```
+        `validate` runs both models on the same held-out images, which must not include the calibration images. The images are decoded and letterboxed once beforehand, so the latencies only cover the forward pass and non-maximum suppression, where the two models actually differ. It then writes `quantization_report.json` with the mean and 95th percentile latency of each model and the share of images where both predict the same severity class.
+
+    3. **Choosing the Model at Load Time**:
+        ```python
+        model = get_model(pick_weights())
+        ```
+        `DetectMultiBackend` picks the ONNX Runtime backend from the `.onnx` extension, so the rest of the worker does not change. `pick_weights` only returns the quantized model if the report shows it agrees with the original model on at least 98% of images and is actually faster; otherwise the worker keeps using `best.pt`.
+        The report stores a SHA-256 hash of both weight files. If `best.pt` is retrained or the int8 model is quantized again, the hashes no longer match and the worker uses `best.pt` until `validate` has been run on the new files.
+    """),
+    ("image", "Assets/Gemini.jpg", "Model 2: Google Gemini"),
+    ("subheader", "🔍 How the Google Gemini Model Works"),
+    ("write", """
+        The Google Gemini model is a powerful tool for generating detailed descriptions of incidents. Here’s how it adds value:
+
+        - **Contextual Understanding**: Unlike traditional models that focus solely on image classification, Gemini provides a narrative description of the incident, helping users understand the context and situation in detail.
+        
+        - **Generative Capabilities**: The model uses advanced generative techniques to craft coherent and relevant descriptions, making it ideal for applications that require rich, informative content based on visual inputs.
+        
+        - **Integration**: We integrate Gemini into our platform to enhance the descriptive capability of our incident reporting system. It complements the YOLOv9 model by providing a more holistic view of the incident.
+
+        Below is an example of how you can use the Google Gemini model for generating descriptions:
+    """),
+    ("code", """
+    import google.generativeai as genai
+    import dotenv
+
+    # Load environment variables
+    dotenv.load_dotenv()
+    
+    # Set up the Google Gemini API key
+    API_KEY = os.getenv("GOOGLE_API_KEY")
+    
+    # Initialize the Gemini client
+    client = genai.Client(api_key=API_KEY)
+    
+    def generate_description(image_path):
+        # Load image
+        with open(image_path, "rb") as image_file:
+            image_data = image_file.read()
+        
+        # Generate description
+        response = client.generate_description(image=image_data)
+        description = response["description"]
+        
+        return description
+    """, "python"),
+    ("write", """
+    ### Code Breakdown and Explanation:
+
+    1. **Imports**:
+        - **google.generativeai**: The module to access Google’s generative AI functionalities.
+        - **dotenv**: A library to load environment variables from a `.env` file, ensuring sensitive information like API keys is securely managed.
+
+    2. **Environment Variables**:
+        ```python
+        dotenv.load_dotenv()
+        API_KEY = os.getenv("GOOGLE_API_KEY")
+        ```
+        Environment variables are used to store sensitive data such as API keys. `dotenv` helps load these variables from a `.env` file.
+
+    3. **Client Initialization**:
+        ```python
+        client = genai.Client(api_key=API_KEY)
+        ```
+        The Google Gemini client is initialized with the API key, allowing communication with the Gemini API.
+
+    4. **Generating Descriptions**:
+        ```python
+        def generate_description(image_path):
+            with open(image_path, "rb") as image_file:
+                image_data = image_file.read()
+            
+            response = client.generate_description(image=image_data)
+            description = response["description"]
+            
+            return description
+        ```
+        This function reads an image file, sends it to the Gemini API, and retrieves a generated description. This description helps provide a contextual understanding of the incident.
+
+    The integration of Google Gemini enhances the user experience by providing detailed and descriptive content, complementing the YOLOv9 model’s severity classification.
+    """),
+    ("subheader", "⚡ Streaming Descriptions with a Cache"),
+    ("write", """
+        `generate_description` waits for the complete description before returning anything, and the same photo uploaded twice pays for two full API calls.
+        The version below streams the description as it is generated and remembers results by image content, so a repeated upload is answered immediately:
+    """),
+    ("code", """
+    import asyncio
+    import hashlib
+    import io
+    import os
+    import time
+    from collections import OrderedDict
+    import google.generativeai as genai
+
+    PROMPT = "Describe the incident shown in this image."
+
+    class GeminiBackend:
+        def __init__(self, api_key, model_name="gemini-1.5-flash"):
+            genai.configure(api_key=api_key)
+            self.model = genai.GenerativeModel(model_name)
+
+        async def stream(self, image_data):
+            image = {"mime_type": "image/jpeg", "data": image_data}
+            response = await self.model.generate_content_async([PROMPT, image], stream=True)
+            async for chunk in response:
+                yield chunk.text
+
+    class StubBackend:
+        # Offline stand-in for tests and local development
+        def __init__(self, text="A two-car collision at an intersection.", delay=0.0):
+            self.text = text
+            self.delay = delay
+            self.calls = 0
+
+        async def stream(self, image_data):
+            self.calls += 1
+            for word in self.text.split(" "):
+                await asyncio.sleep(self.delay)
+                yield word + " "
+
+    class DescriptionCache:
+        def __init__(self, max_entries=1024, ttl=24 * 60 * 60):
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self.entries = OrderedDict()  # key -> (created_at, description)
+
+        def get(self, key):
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self.entries.pop(key, None)
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        def put(self, key, description):
+            self.entries[key] = (time.monotonic(), description)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def image_key(image_data):
+        try:
+            # Optional: perceptual hash, so re-encoded or resized copies of a photo also match
+            import imagehash
+            from PIL import Image
+            return "phash:" + str(imagehash.phash(Image.open(io.BytesIO(image_data))))
+        except ImportError:
+            return "sha256:" + hashlib.sha256(image_data).hexdigest()
+
+    backend = GeminiBackend(os.getenv("GOOGLE_API_KEY")) if os.getenv("GOOGLE_API_KEY") else StubBackend()
+    cache = DescriptionCache()
+    in_flight = {}  # key -> future for the description of an image that is still being streamed
+
+    async def stream_description(image_path):
+        with open(image_path, "rb") as image_file:
+            image_data = image_file.read()
+
+        key = image_key(image_data)
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        flight = in_flight.get(key)
+        if flight is not None:
+            # The same image is already being described: wait for that call instead of making another
+            description = await asyncio.shield(flight)
+            if description is not None:
+                yield description
+                return
+
+        future = asyncio.get_running_loop().create_future()
+        in_flight[key] = future
+        parts = []
+        try:
+            async for token in backend.stream(image_data):
+                parts.append(token)
+                yield token
+            description = "".join(parts)
+            cache.put(key, description)
+            future.set_result(description)
+        finally:
+            if in_flight.get(key) is future:
+                del in_flight[key]
+            if not future.done():
+                future.set_result(None)  # Failed or abandoned: waiting callers make their own call
+    """, "python"),
+    ("write", """
+    ### How It Works:
+
+    1. **Streaming**:
+        ```python
+        async for token in backend.stream(image_data):
+            yield token
+        ```
+        `stream_description` is an async generator. Each piece of text is passed on as soon as Gemini produces it, so the first words can be pushed to the client over the WebSocket while the rest is still being generated.
+
+    2. **Content-Based Cache**:
+        ```python
+        key = image_key(image_data)
+        cached = cache.get(key)
+        ```
+        Results are stored under a hash of the image bytes, not the file name, so the same photo uploaded again returns the stored description without calling the API. When the optional `imagehash` package is installed a perceptual hash is used instead, which also matches resized or re-compressed copies of the same photo.
+
+    3. **Expiry and Size Limit**:
+        ```python
+        DescriptionCache(max_entries=1024, ttl=24 * 60 * 60)
+        ```
+        Entries expire after a day and the least recently used ones are dropped once the cache is full, so memory use stays bounded.
+
+    4. **One Call for Concurrent Duplicates**:
+        ```python
+        flight = in_flight.get(key)
+        if flight is not None:
+            description = await asyncio.shield(flight)
+        ```
+        The cache is only filled once a description is complete, and a burst of re-uploads usually arrives before that. While an image is being described, its key maps to a future in `in_flight`, and every other request for the same image waits for that future instead of calling Gemini again. If the first call fails or its client disconnects, the future resolves to `None` and the waiting requests fall back to calling the API themselves.
+
+    5. **Stub Backend**:
+        ```python
+        backend = GeminiBackend(os.getenv("GOOGLE_API_KEY")) if os.getenv("GOOGLE_API_KEY") else StubBackend()
+        ```
+        Without an API key the code falls back to `StubBackend`, which streams a fixed description word by word. Tests and local runs work offline and cost nothing.
+        It also counts how often it is called, so a test can check that a burst of identical uploads reaches the backend only once. Assuming the code above is saved as `descriptions.py`:
+    """),
+    ("code", """
+    import asyncio
+    from PIL import Image
+    import descriptions
+    from descriptions import DescriptionCache, StubBackend
+
+    async def describe(path):
+        return "".join([token async for token in descriptions.stream_description(path)])
+
+    def test_identical_uploads_call_the_backend_once(monkeypatch, tmp_path):
+        backend = StubBackend(text="A fire in a parked car.", delay=0.01)
+        monkeypatch.setattr(descriptions, "backend", backend)
+        monkeypatch.setattr(descriptions, "cache", DescriptionCache())
+        monkeypatch.setattr(descriptions, "in_flight", {})
+        image = tmp_path / "upload.jpg"
+        Image.new("RGB", (64, 64), "red").save(image)
+
+        async def burst():
+            return await asyncio.gather(*(describe(image) for _ in range(5)))
+
+        assert asyncio.run(burst()) == ["A fire in a parked car. "] * 5
+        assert backend.calls == 1
+
+        assert asyncio.run(describe(image)) == "A fire in a parked car. "  # Answered from the cache
+        assert backend.calls == 1
+    """, "python"),
+    ("subheader", "🔀 Running Both Models for Each Upload"),
+    ("write", """
+        The two models do not depend on each other: YOLOv9 only needs the image to produce a severity, and Gemini only needs the image to produce a description. Running them one after the other makes every upload wait for the sum of both.
+        The orchestrator below runs both stages at the same time, limits how many of each run at once, gives severe incidents first access to Gemini, and saves each result as soon as it is ready:
+    """),
+    ("code", """
+    import asyncio
+    import heapq
+    import itertools
+    import queue
+    import threading
+    import time
+    import torch
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from utils.general import non_max_suppression
+
+    SEVERITY_TIMEOUT = 5  # seconds
+    DESCRIPTION_TIMEOUT = 30
+    SEVERITY_GRACE = 0.5  # How long Gemini waits for a severity to decide its priority
+    SEVERITY_RANK = {"severe": 0, "moderate": 1}
+
+    class PriorityLimiter:
+        # Like asyncio.Semaphore, but waiters with the lowest priority value go first
+        def __init__(self, limit):
+            self.free = limit
+            self.waiters = []
+            self.counter = itertools.count()
+
+        async def acquire(self, priority):
+            if self.free > 0 and not self.waiters:
+                self.free -= 1
+                return
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self.waiters, (priority, next(self.counter), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release()  # We were handed a slot but no longer need it
+                raise
+
+        def release(self):
+            while self.waiters:
+                _, _, future = heapq.heappop(self.waiters)
+                if not future.done():
+                    future.set_result(None)
+                    return
+            self.free += 1
+
+    class SeverityBatcher:
+        # One thread owns the model and runs every image that is waiting as a single batch, like run_batched
+        def __init__(self, weights='yolo.pt', imgsz=640, max_batch=16, workers=4, conf_thres=0.25, iou_thres=0.45):
+            self.model = get_model(weights, 'cpu', imgsz)
+            self.imgsz = imgsz
+            self.max_batch = max_batch
+            self.thresholds = (conf_thres, iou_thres)
+            self.decoder = ThreadPoolExecutor(max_workers=workers)
+            self.queue = queue.Queue()
+            threading.Thread(target=self.loop, daemon=True).start()
+
+        def submit(self, path):
+            future = Future()
+            self.queue.put((self.decoder.submit(load_image, path, self.imgsz), future))
+            return future
+
+        def loop(self):
+            while True:
+                batch = [self.queue.get()]
+                while len(batch) < self.max_batch and not self.queue.empty():
+                    batch.append(self.queue.get())
+
+                images, futures = [], []
+                for decoded, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue  # Cancelled while queued
+                    try:
+                        images.append(torch.from_numpy(decoded.result()))
+                        futures.append(future)
+                    except Exception as e:
+                        future.set_exception(e)
+                if not images:
+                    continue
+
+                try:
+                    with torch.no_grad():
+                        pred = self.model(torch.stack(images).float() / 255.0)
+                    dets = non_max_suppression(pred, *self.thresholds)
+                except Exception as e:
+                    for future in futures:
+                        future.set_exception(e)
+                    continue
+                for future, det in zip(futures, dets):
+                    classes = det[:, 5].long()
+                    future.set_result(self.model.names[int(classes.bincount().argmax())] if len(det) else "No_incident")
+
+    batcher = SeverityBatcher()
+    yolo_slots = asyncio.Semaphore(16)  # Uploads queued for or inside YOLOv9: one full batch
+    gemini_slots = PriorityLimiter(8)  # Network bound: limited by the API quota
+
+    async def process_upload(upload, save_result):
+        deadline = upload["received_at"] + DESCRIPTION_TIMEOUT
+        loop = asyncio.get_running_loop()
+
+        async def severity_stage():
+            await yolo_slots.acquire()
+            future = batcher.submit(upload["image_path"])
+            # Give the slot back when the inference has really finished, even if we stopped waiting for it
+            future.add_done_callback(lambda _: loop.call_soon_threadsafe(yolo_slots.release))
+            severity = await asyncio.wait_for(asyncio.wrap_future(future), SEVERITY_TIMEOUT)
+            await save_result(upload["id"], severity=severity)  # Saved without waiting for Gemini
+            return severity
+
+        async def description_stage(severity_task):
+            await asyncio.wait({severity_task}, timeout=SEVERITY_GRACE)
+            severity = severity_task.result() if severity_task.done() and not severity_task.exception() else None
+            priority = (SEVERITY_RANK.get(severity, len(SEVERITY_RANK)), deadline)
+
+            await gemini_slots.acquire(priority)
+            try:
+                remaining = max(deadline - time.time(), 0)
+                parts = await asyncio.wait_for(
+                    collect(stream_description(upload["image_path"])), remaining
+                )
+            finally:
+                gemini_slots.release()
+            description = "".join(parts)
+            await save_result(upload["id"], description=description)
+            return description
+
+        severity_task = asyncio.create_task(severity_stage())
+        description_task = asyncio.create_task(description_stage(severity_task))
+        return await asyncio.gather(severity_task, description_task, return_exceptions=True)
+
+    async def collect(stream):
+        return [token async for token in stream]
+    """, "python"),
+    ("write", """
+    ### How It Works:
+
+    1. **Both Stages at Once**:
+        ```python
+        severity_task = asyncio.create_task(severity_stage())
+        description_task = asyncio.create_task(description_stage(severity_task))
+        ```
+        Each upload starts the YOLOv9 and Gemini stages together, so the total time is that of the slower stage instead of the sum of both.
+
+    2. **Shared Batches for YOLOv9**:
+        ```python
+        future = batcher.submit(upload["image_path"])
+        ```
+        Uploads do not each run the model. `SeverityBatcher` uses the model loaded once by `get_model`, and its thread runs every image that has arrived in the meantime as one batch, the same way `run_batched` does. The event loop only waits for the image's future, so inference never blocks it.
+
+    3. **Results Saved Independently**:
+        ```python
+        await save_result(upload["id"], severity=severity)
+        ```
+        The severity is saved, and can be shown on the newsfeed, as soon as YOLOv9 finishes. The description is added when Gemini is done.
+
+    4. **Timeouts per Stage**:
+        ```python
+        await asyncio.wait_for(..., SEVERITY_TIMEOUT)
+        ```
+        Each stage has its own time limit. A slow Gemini response never holds back the severity, and `return_exceptions=True` keeps one failed stage from discarding the other stage's result.
+
+    5. **Bounded Concurrency and Priority**:
+        ```python
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(yolo_slots.release))
+        priority = (SEVERITY_RANK.get(severity, len(SEVERITY_RANK)), deadline)
+        await gemini_slots.acquire(priority)
+        ```
+        Only a fixed number of uploads use each model at a time. A timeout cannot stop an inference that is already running, so a YOLOv9 slot is only given back once the batcher has actually finished with the image (or dropped it from the queue), not when the upload stops waiting. Under overload the limit therefore still holds. When all Gemini slots are busy, waiting uploads are served severe first, then moderate, then unknown, and within the same severity the one closest to its deadline goes first. Gemini waits at most `SEVERITY_GRACE` for the severity; YOLOv9 usually finishes well within that.
+    """),
+    ("subheader", "🧩 Grouping Duplicate Reports"),
+    ("write", """
+        When something serious happens, many people photograph the same accident or fire from almost the same spot within minutes. Running both models on every one of those photos produces the same severity and a very similar description each time.
+        Before an upload reaches the models, the worker can check whether it belongs to an incident that is already being handled:
+    """),
+    ("code", """
+    import asyncio
+    import itertools
+    import math
+    import time
+    import imagehash
+    from PIL import Image
+
+    STRONG_MATCH = 6  # Differing bits out of 64 in the perceptual hash
+    WEAK_MATCH = 12
+    MAX_DISTANCE_M = 150
+    MAX_AGE = 30 * 60  # seconds
+    PRUNE_EVERY = 60
+    CELL_DEG = 0.01  # Roughly 1 km grid cells
+
+    def distance_m(lat1, lon1, lat2, lon2):
+        # Haversine distance in metres
+        p1, p2 = math.radians(lat1), math.radians(lat2)
+        dp, dl = p2 - p1, math.radians(lon2 - lon1)
+        a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+        return 2 * 6371000 * math.asin(math.sqrt(a))
+
+    class IncidentClusters:
+        def __init__(self):
+            self.cells = {}  # (row, col) -> clusters
+            self.ids = itertools.count(1)
+            self.pruned_at = 0
+
+        def cell(self, lat, lon):
+            return (math.floor(lat / CELL_DEG), math.floor(lon / CELL_DEG))
+
+        def find(self, phash, lat, lon, now):
+            row, col = self.cell(lat, lon)
+            best, best_bits = None, WEAK_MATCH + 1
+            for dr, dc in itertools.product((-1, 0, 1), repeat=2):
+                for cluster in self.cells.get((row + dr, col + dc), ()):
+                    if now - cluster["last_seen"] > MAX_AGE:
+                        continue
+                    if distance_m(lat, lon, cluster["lat"], cluster["lon"]) > MAX_DISTANCE_M:
+                        continue
+                    bits = phash - cluster["phash"]
+                    if bits < best_bits:
+                        best, best_bits = cluster, bits
+            return best, best_bits
+
+        def add(self, phash, lat, lon, now):
+            cluster = {"id": next(self.ids), "phash": phash, "lat": lat, "lon": lon, "last_seen": now, "task": None}
+            self.cells.setdefault(self.cell(lat, lon), []).append(cluster)
+            return cluster
+
+        def prune(self, now):
+            # Forget incidents nobody has reported for MAX_AGE, and the cells they leave empty
+            if now - self.pruned_at < PRUNE_EVERY:
+                return
+            self.pruned_at = now
+            for key, cell in list(self.cells.items()):
+                cell[:] = [cluster for cluster in cell if now - cluster["last_seen"] <= MAX_AGE]
+                if not cell:
+                    del self.cells[key]
+
+    clusters = IncidentClusters()
+
+    async def analyse(upload, save_result):
+        severity, description = await process_upload(upload, save_result)
+        return (severity if isinstance(severity, str) else None,
+                description if isinstance(description, str) else None)
+
+    def usable(task):
+        # A cancelled or failed run counts like one that found nothing: the next report runs the models again
+        if task.cancelled() or task.exception() is not None:
+            return False
+        severity, description = task.result()
+        return severity not in (None, "No_incident") and description is not None
+
+    def image_phash(path):
+        with Image.open(path) as image:
+            return imagehash.phash(image)
+
+    async def handle_upload(upload, save_result):
+        # Decoding the photo is CPU work, so it runs off the event loop
+        phash = await asyncio.get_running_loop().run_in_executor(None, image_phash, upload["image_path"])
+        now = time.time()
+        clusters.prune(now)
+        cluster, bits = clusters.find(phash, upload["latitude"], upload["longitude"], now)
+
+        if cluster is None:
+            cluster = clusters.add(phash, upload["latitude"], upload["longitude"], now)
+        cluster["last_seen"] = now
+
+        while bits <= STRONG_MATCH and cluster["task"] is not None:
+            # Same incident: reuse its results, waiting for the analysis if it is still running
+            task = cluster["task"]
+            await asyncio.wait({task})
+            if usable(task):
+                severity, description = task.result()
+                await save_result(upload["id"], cluster_id=cluster["id"], severity=severity, description=description)
+                return
+            if cluster["task"] is task:
+                break  # Nobody has started another run yet, so this upload does
+
+        # Registered before the next await, so every report arriving from now on finds this run
+        own = asyncio.create_task(analyse(upload, save_result))
+        if cluster["task"] is None or cluster["task"].done() and not usable(cluster["task"]):
+            cluster["task"] = own
+        await save_result(upload["id"], cluster_id=cluster["id"])
+        await own
+    """, "python"),
+    ("write", """
+    ### How It Works:
+
+    1. **Perceptual Hash**:
+        ```python
+        phash = await asyncio.get_running_loop().run_in_executor(None, image_phash, upload["image_path"])
+        ```
+        A perceptual hash is a 64-bit fingerprint of what an image looks like. Two photos of the same scene taken a few steps apart differ in only a few bits, so `phash - cluster["phash"]` (the number of differing bits) measures how similar they are. Decoding the photo takes a few milliseconds of CPU, so it runs in a thread; the file is closed as soon as the hash is computed.
+
+    2. **Close in Space and Time**:
+        ```python
+        if now - cluster["last_seen"] > MAX_AGE: ...
+        if distance_m(lat, lon, cluster["lat"], cluster["lon"]) > MAX_DISTANCE_M: ...
+        ```
+        Only incidents reported within the last 30 minutes and 150 metres are considered. Clusters are kept in a grid of roughly 1 km cells, so only the upload's own cell and its eight neighbours are searched rather than every open incident.
+
+    3. **Reuse When Confident**:
+        ```python
+        own = asyncio.create_task(analyse(upload, save_result))
+        cluster["task"] = own
+        ...
+        await asyncio.wait({task})
+        ```
+        Each cluster keeps the task analysing its first photo. The task is stored on the cluster before `handle_upload` awaits anything, so a near-identical photo that arrives a moment later always finds it. That photo waits for the task, even while it is still running, and reuses its severity and description without running YOLOv9 or Gemini. Most duplicates arrive during the first minutes, while the first analysis is still under way, so this is where the savings come from.
+        Weaker matches are still attached to the same cluster, but the models run again. They also run again when the earlier run found no incident, failed or was cancelled. In that case the new run becomes the one later reports wait for.
+
+    4. **Bounded Memory**:
+        ```python
+        clusters.prune(now)
+        ```
+        Once a minute, clusters that have not been reported for `MAX_AGE` are dropped together with any grid cells left empty, and neighbour lookups use `self.cells.get(...)` so searching never creates cells. A long-running worker therefore only holds the incidents of the last half hour.
+    """),
+    ("write", """
+    ### Conclusion
+
+    Suraksha’s ML models provide a comprehensive solution for incident detection and context understanding. By combining the robust detection capabilities of YOLOv9 with the descriptive power of Google Gemini, we ensure a thorough analysis of all kinds of  incidents. This integration not only improves the accuracy of severity detection but also provides valuable insights into the nature of each incident, making our platform a valuable tool for real-time incident management and response.
+
+    Feel free to explore our models further and see how they can enhance your incident management processes!
+    """),
+)
+
+
+def machine_learning():
+    render(CONTENT)
@@ -0,0 +1,34 @@
+import re
+
+import streamlit as st
+
+from assets import show_image
+from sections.graph import show_graph
+
+
+def slugify(text):
+    text = re.sub(r"[^\w\s-]", "", text.lower()).strip()
+    return re.sub(r"[\s_-]+", "-", text)
+
+
+# Page content is kept as plain data at module level, so it is built once per
+# process when the page module is first imported and reused on every rerun.
+def render(content):
+    for kind, *args in content:
+        if kind == "title":
+            st.title(args[0], anchor=slugify(args[0]))
+        elif kind == "subheader":
+            st.subheader(args[0], anchor=slugify(args[0]))
+        elif kind == "write":
+            st.write(args[0])
+        elif kind == "markdown":
+            st.markdown(args[0])
+        elif kind == "code":
+            st.code(args[0], language=args[1])
+        elif kind == "image":
+            show_image(args[0], caption=args[1], width=args[2] if len(args) > 2 else None)
+        elif kind == "graph":
+            # args: spec, fallback image for places that cannot run the component, caption
+            show_graph(args[0], caption=args[2])
+        else:
+            raise ValueError(f"Unknown content block: {kind}")